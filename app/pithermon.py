@@ -71,6 +71,7 @@ ForeSail-1 / Raspberry Pi temperature and thermal throttling monitor
 Version {}, 2018-2019 {}
 """.format(__version__, __author__)
 
+import io
 import os
 import re
 import sys
@@ -80,6 +81,7 @@ import argparse
 import platform
 import textwrap
 import subprocess
+import concurrent.futures
 
 __moduleName = os.path.basename(os.path.splitext(__file__)[0])
 __fileName   = os.path.basename(__file__)
@@ -101,6 +103,9 @@ class Config():
     # Data read interval in seconds
     # Values under 0.5 should be avoided
     Interval      = 1.0
+    # Number of CSV rows to collect in memory before
+    # they are written out to the file.
+    CSV_Flush_Rows = 64
     # Output console beeps when system is throttling
     # None = beeps are disabled
     # Otherwise the value must be a float that defines
@@ -116,6 +121,7 @@ class Config():
         print('Config.CSV_File =',      Config.CSV_File)
         print('Config.CSV_Dialect =',   Config.CSV_Dialect)
         print('Config.Interval =',      Config.Interval)
+        print('Config.CSV_Flush_Rows =', Config.CSV_Flush_Rows)
         print('Config.Console_Alert =', Config.Console_Alert)
 
 #
@@ -130,10 +136,65 @@ class Data():
     cpu_volts   = 0.0
     gpu_temp    = 0.0
     throttled   = 0x00
+    uv_now      = 0
+    fc_now      = 0
+    th_now      = 0
+    uv_occurred = 0
+    fc_occurred = 0
+    th_occurred = 0
     decimal_separator = '.'
+    # "[UAT]" strings for every combination of the three "right now" and
+    # three "has occurred" throttle bits, indexed by (occurred << 3) | now.
+    # Upper case = happening now, lower case = has occurred, space = never.
+    _UAT_TABLE = tuple(
+        "[{}{}{}]".format(
+            "U" if bits & 0x01 else "u" if bits & 0x08 else " ",
+            "A" if bits & 0x02 else "a" if bits & 0x10 else " ",
+            "T" if bits & 0x04 else "t" if bits & 0x20 else " "
+        )
+        for bits in range(64)
+    )
     def __init__(self, dialect):
         if dialect == 'finnish':
             self.decimal_separator = ','
+        # Translation table for the decimal separator, or None when the
+        # '%.1f' output is already correct for the dialect.
+        if self.decimal_separator != '.':
+            self._xlat = str.maketrans('.', self.decimal_separator)
+            self._fval = lambda f, x=self._xlat: ('%.1f' % f).translate(x)
+        else:
+            self._xlat = None
+            self._fval = lambda f: '%.1f' % f
+        # Config.Logging_Level is fixed once commandline arguments have
+        # been parsed, so the level branch is resolved here once instead
+        # of on every header()/row() call.
+        level = Config.Logging_Level.lower()
+        self.header  = getattr(self, '_header_' + level)
+        self.row     = getattr(self, '_row_' + level)
+        self.row_raw = getattr(self, '_row_raw_' + level)
+        # Complete printf-style template for one CSV row, used by
+        # csv_line() to emit a row without going through the csv module.
+        # The field specifiers are joined once here, with the dialect's
+        # quoting baked in; no field of ours can ever contain a delimiter
+        # or quote character, so QUOTE_MINIMAL means no quotes at all and
+        # QUOTE_ALL means a fixed quote around every field. Only an
+        # unknown quoting policy still needs csv.writer for its rows.
+        dialect_spec = csv.get_dialect(dialect)
+        float_count, flag_count = {
+            'basic':    (2, 2),
+            'standard': (4, 3),
+            'full':     (5, 6)
+        }[level]
+        specs = ['%s'] + ['%.1f'] * float_count + ['%d'] * flag_count
+        if dialect_spec.quoting == csv.QUOTE_ALL:
+            quote = dialect_spec.quotechar
+            specs = [quote + spec + quote for spec in specs]
+        self.csv_fastpath = dialect_spec.quoting in (
+            csv.QUOTE_MINIMAL,
+            csv.QUOTE_ALL
+        )
+        self._line_fmt = dialect_spec.delimiter.join(specs) \
+                         + dialect_spec.lineterminator
     def read(self, now):
         self.time = lapsed_time(now)
         # self.datetime = time.strftime(
@@ -141,97 +202,184 @@ class Data():
         #     time.localtime(next_tick)
         # )
         self.cpu_temp  = cpu_temp()
-        self.cpu_load  = cpu_load()
         self.cpu_freq  = cpu_freq()
         self.cpu_volts = cpu_volts()
         self.gpu_temp  = gpu_temp()
         self.throttled = get_throttled()
-    def header(self):
-        if Config.Logging_Level == 'BASIC':
-            return  (
-                        'Time',
-                        'CPU Temperature',
-                        'CPU MHz',
-                        'ARM Frequency Capped',
-                        'Throttled'
-                    )
-        elif Config.Logging_Level == 'STANDARD':
-            return  (
-                        'Time',
-                        'CPU Temperature',
-                        'CPU Load',
-                        'CPU MHz',
-                        'CPU Volts',
-                        'Undervoltage',
-                        'ARM Frequency Capped',
-                        'Throttled'
-                    )
-        else: # FULL
-            return  (
-                        'Time',
-                        'CPU Temperature',
-                        'CPU Load',
-                        'CPU MHz',
-                        'CPU Volts',
-                        'GPU Temperature',
-                        'Undervoltage',
-                        'ARM Frequency Capped',
-                        'Throttled',
-                        'Undervoltage has occured',
-                        'ARM Frequencey Capping has occured',
-                        'Throttling has occured'
-                    )
-    def __float2str(self, fval):
-        if self.decimal_separator != '.':
-            return str(round(fval, 1)).replace('.', self.decimal_separator)
-        else:
-            return str(round(fval, 1))
-    def row(self):
-        if Config.Logging_Level == 'BASIC':
-            return  (
-                        data.time,
-                        self.__float2str(self.cpu_temp),
-                        self.__float2str(self.cpu_freq),
-                        1 if self.throttled & 0x02 else 0,
-                        1 if self.throttled & 0x04 else 0
-                    )
-        elif Config.Logging_Level == 'STANDARD':
-            return  (
-                        data.time,
-                        self.__float2str(self.cpu_temp),
-                        self.__float2str(self.cpu_load),
-                        self.__float2str(self.cpu_freq),
-                        self.__float2str(self.cpu_volts),
-                        1 if self.throttled & 0x01 else 0,
-                        1 if self.throttled & 0x02 else 0,
-                        1 if self.throttled & 0x04 else 0
-                    )
-        else: # FULL
-            return  (
-                    data.time,
-                    self.__float2str(self.cpu_temp),
-                    self.__float2str(self.cpu_load),
-                    self.__float2str(self.cpu_freq),
-                    self.__float2str(self.cpu_volts),
-                    self.__float2str(self.gpu_temp),
-                    1 if self.throttled & 0x01 else 0,
-                    1 if self.throttled & 0x02 else 0,
-                    1 if self.throttled & 0x04 else 0,
-                    1 if self.throttled & 0x10000 else 0,
-                    1 if self.throttled & 0x20000 else 0,
-                    1 if self.throttled & 0x40000 else 0
-                    )
+        # All per-tick arithmetic (load division, throttle bit unpacking)
+        # lives in the _compute_metrics() kernel.
+        global _prev_active, _prev_total
+        if _prev_total == 0:
+            _prev_active, _prev_total = cpu_times()
+        curr_active, curr_total = cpu_times()
+        (self.cpu_load,
+         self.uv_now, self.fc_now, self.th_now,
+         self.uv_occurred, self.fc_occurred, self.th_occurred) = \
+            _compute_metrics(
+                curr_active, curr_total,
+                _prev_active, _prev_total,
+                self.throttled
+            )
+        _prev_active, _prev_total = curr_active, curr_total
+    def _header_basic(self):
+        return  (
+                    'Time',
+                    'CPU Temperature',
+                    'CPU MHz',
+                    'ARM Frequency Capped',
+                    'Throttled'
+                )
+    def _header_standard(self):
+        return  (
+                    'Time',
+                    'CPU Temperature',
+                    'CPU Load',
+                    'CPU MHz',
+                    'CPU Volts',
+                    'Undervoltage',
+                    'ARM Frequency Capped',
+                    'Throttled'
+                )
+    def _header_full(self):
+        return  (
+                    'Time',
+                    'CPU Temperature',
+                    'CPU Load',
+                    'CPU MHz',
+                    'CPU Volts',
+                    'GPU Temperature',
+                    'Undervoltage',
+                    'ARM Frequency Capped',
+                    'Throttled',
+                    'Undervoltage has occured',
+                    'ARM Frequencey Capping has occured',
+                    'Throttling has occured'
+                )
+    def _row_basic(self):
+        return  (
+                    self.time,
+                    self._fval(self.cpu_temp),
+                    self._fval(self.cpu_freq),
+                    self.fc_now,
+                    self.th_now
+                )
+    def _row_standard(self):
+        return  (
+                    self.time,
+                    self._fval(self.cpu_temp),
+                    self._fval(self.cpu_load),
+                    self._fval(self.cpu_freq),
+                    self._fval(self.cpu_volts),
+                    self.uv_now,
+                    self.fc_now,
+                    self.th_now
+                )
+    def _row_full(self):
+        return  (
+                    self.time,
+                    self._fval(self.cpu_temp),
+                    self._fval(self.cpu_load),
+                    self._fval(self.cpu_freq),
+                    self._fval(self.cpu_volts),
+                    self._fval(self.gpu_temp),
+                    self.uv_now,
+                    self.fc_now,
+                    self.th_now,
+                    self.uv_occurred,
+                    self.fc_occurred,
+                    self.th_occurred
+                )
+    def _row_raw_basic(self):
+        return  (
+                    self.time,
+                    self.cpu_temp,
+                    self.cpu_freq,
+                    self.fc_now,
+                    self.th_now
+                )
+    def _row_raw_standard(self):
+        return  (
+                    self.time,
+                    self.cpu_temp,
+                    self.cpu_load,
+                    self.cpu_freq,
+                    self.cpu_volts,
+                    self.uv_now,
+                    self.fc_now,
+                    self.th_now
+                )
+    def _row_raw_full(self):
+        return  (
+                    self.time,
+                    self.cpu_temp,
+                    self.cpu_load,
+                    self.cpu_freq,
+                    self.cpu_volts,
+                    self.gpu_temp,
+                    self.uv_now,
+                    self.fc_now,
+                    self.th_now,
+                    self.uv_occurred,
+                    self.fc_occurred,
+                    self.th_occurred
+                )
+    def csv_line(self):
+        """One complete CSV row as a string, bypassing the csv module
+
+        Valid only when no field can require quoting (see csv_fastpath)."""
+        line = self._line_fmt % self.row_raw()
+        return line.translate(self._xlat) if self._xlat else line
     def throttled_string(self):
         """[UAT] string for stdout"""
-        u = self.throttled & 0x00010001
-        a = self.throttled & 0x00020002
-        t = self.throttled & 0x00040004
-        return  "[{}{}{}]" \
-                .format(
-                    "U" if u & 0x01 else "u" if u > 0x00 else " ",
-                    "A" if a & 0x02 else "a" if a > 0x00 else " ",
-                    "T" if t & 0x04 else "t" if t > 0x00 else " "
-                )
+        now  = self.throttled & 0x07
+        ever = (self.throttled >> 16) & 0x07
+        return self._UAT_TABLE[(ever << 3) | now]
+
+#
+# Persistent vcgencmd child process
+#
+# Forking '/opt/vc/bin/vcgencmd' four times per interval costs milliseconds
+# each on a Pi and dominates the per-sample work. vcgencmd accepts commands
+# on stdin when started without arguments, so one long-lived child can serve
+# every query over a pipe. Should the child die, queries transparently fall
+# back to one-shot invocations.
+#
+class VcgencmdProc():
+    command = '/opt/vc/bin/vcgencmd'
+    def __init__(self):
+        self.proc = None
+        self.start()
+    def start(self):
+        try:
+            self.proc = subprocess.Popen(
+                [VcgencmdProc.command],
+                stdin   = subprocess.PIPE,
+                stdout  = subprocess.PIPE,
+                bufsize = -1
+            )
+        except OSError:
+            self.proc = None
+    def query(self, cmdline):
+        """Send one command (bytes) and return the 'name=value' reply line (bytes)"""
+        if self.proc is not None and self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(cmdline + b'\n')
+                self.proc.stdin.flush()
+                line = self.proc.stdout.readline()
+                # An empty readline means the child closed its stdout
+                # (died after the poll() check) - fall back below.
+                if line:
+                    return line
+                self.proc = None
+            except OSError:
+                self.proc = None
+        # Persistent process has exited - use a one-shot invocation
+        return subprocess.check_output(
+            [VcgencmdProc.command] + cmdline.decode('ascii').split()
+        )
+
+# Module level singleton, created once at startup
+vcgencmd = VcgencmdProc()
 
 #
 # Register Finnish CSV dialect (only delimeter differs from defaults)
@@ -253,27 +401,36 @@ def get_model():
         print('ERROR: %s' % e)
         sys.exit(3)
 
-def get_revision():
-    """Return revision number of the board, as a string"""
+def _cpuinfo_fields():
+    """Read /proc/cpuinfo once and return its 'name : value' lines as a dict"""
+    try:
+        return _cpuinfo_fields._cache
+    except AttributeError:
+        pass
     try:
-        with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line[0:8] == 'Revision':
-                    return line[line.find(':') + 1:].strip()
+        fd = os.open('/proc/cpuinfo', os.O_RDONLY)
+        try:
+            buf = os.read(fd, 65536)
+        finally:
+            os.close(fd)
     except IOError as e:
         print('ERROR: %s' % e)
         sys.exit(3)
+    fields = {}
+    for line in buf.split(b'\n'):
+        name, sep, value = line.partition(b':')
+        if sep:
+            fields[name.strip().decode('utf-8')] = value.strip().decode('utf-8')
+    _cpuinfo_fields._cache = fields
+    return fields
+
+def get_revision():
+    """Return revision number of the board, as a string"""
+    return _cpuinfo_fields().get('Revision')
 
 def get_serial():
     """Return serial number of the BCM chip as a string"""
-    try:
-        with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line[0:6] == 'Serial':
-                    return line[line.find(':') + 1:].strip()
-    except IOError as e:
-        print('ERROR: %s' % e)
-        sys.exit(3)
+    return _cpuinfo_fields().get('Serial')
 
 def get_firmware():
     cmd = '/opt/vc/bin/vcgencmd'
@@ -281,64 +438,99 @@ def get_firmware():
     return subprocess.check_output([cmd, arg]).decode('utf-8')
 
 
+# Compiled once for cpu_times() - every counter on the /proc/stat
+# summary line is a plain run of decimal digits.
+_STAT_RE = re.compile(rb'\d+')
+
 def cpu_times():
     """
     Returns a tuple of active and total CPU times. (active, total)
     """
-    # cpu user nice system idle iowait irq softirq steal guest
-    # 0   1    2    3      4    5      6   7       8     9
-    active_indeces = [1, 2, 3, 7, 8]
+    # cpu user nice system idle iowait irq softirq steal guest guest_nice
+    #     0    1    2      3    4      5   6       7     8     9
     try:
-        with open('/proc/stat', 'r') as procfile:
-            cputimes  = procfile.readline()
-            cputotal  = 0
-            cpuactive = 0
-            for index, element in enumerate(cputimes.split(' ')[2:]):
-                value = int(element)
-                cputotal += value
-                if index in active_indeces:
-                    cpuactive += value
-            return (cpuactive, cputotal)
-    except IOError as e:
-        print('ERROR: %s' % e)
-        sys.exit(3)
+        fd = cpu_times._fd
+    except AttributeError:
+        try:
+            fd = cpu_times._fd = os.open('/proc/stat', os.O_RDONLY)
+        except IOError as e:
+            print('ERROR: %s' % e)
+            sys.exit(3)
+    # Only the summary line matters - bound the read to 160 bytes and
+    # clip at the first newline so the per-cpu lines are never copied or
+    # scanned. The counters are the first ten digit runs on the line.
+    buf = os.pread(fd, 160, 0)
+    vals = list(map(int, _STAT_RE.findall(buf[:buf.find(b'\n')])[:10]))
+    cputotal  = sum(vals)
+    cpuactive = vals[0] + vals[1] + vals[2] + vals[6] + vals[7]
+    return (cpuactive, cputotal)
+
+# Previous cpu_times() sample for cpu_load(), kept as two plain ints so
+# that no tuple object is stored per tick on a long-running monitor.
+_prev_active = 0
+_prev_total  = 0
+
+def _compute_metrics(curr_active, curr_total, prev_active, prev_total, throttled):
+    """
+    Pure-numeric per-tick kernel used by Data.read().
+    Returns (load, uv_now, fc_now, th_now, uv_occurred, fc_occurred,
+    th_occurred) from plain integer counters and the throttle word.
+    Deliberately free of any Python object types so it could be handed to
+    a JIT compiler as-is, should sub-0.1 s intervals ever call for one.
+    """
+    delta_total = curr_total - prev_total
+    if delta_total > 0:
+        load = 100.0 * (curr_active - prev_active) / delta_total
+    else:
+        load = 0.0
+    return (
+        load,
+        (throttled      ) & 0x01,
+        (throttled >>  1) & 0x01,
+        (throttled >>  2) & 0x01,
+        (throttled >> 16) & 0x01,
+        (throttled >> 17) & 0x01,
+        (throttled >> 18) & 0x01
+    )
 
 def cpu_load():
-    try:
-        prev = cpu_load.prev
-    except AttributeError:
-        prev = cpu_times()
-    curr = cpu_times()
+    global _prev_active, _prev_total
+    if _prev_total == 0:
+        _prev_active, _prev_total = cpu_times()
+    curr_active, curr_total = cpu_times()
     try:
         load =  100.0 * \
-                (float(curr[1] - prev[1]) - float(curr[0] - prev[0])) / \
-                float(curr[1] - prev[1])
+                (curr_active - _prev_active) / \
+                (curr_total - _prev_total)
     except ZeroDivisionError:
         load = 0.0
-    cpu_load.prev = curr
+    _prev_active, _prev_total = curr_active, curr_total
     return load
 
 def cpu_freq():
     """ARM clock frequency MHz (float)"""
-    cmd  = '/opt/vc/bin/vcgencmd'
-    arg1 = 'measure_clock'
-    arg2 = 'arm'
-    string = subprocess.check_output([cmd, arg1, arg2]).decode('utf-8')
-    return float(string[string.find('=') + 1:].strip()) / 1000000.0
+    raw = vcgencmd.query(b'measure_clock arm')
+    return int(raw.partition(b'=')[2]) / 1000000.0
 
 def cpu_temp():
     try:
-        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as tempfile:
-            return float(tempfile.read()) / 1000
-    except IOError as e:
-        print('ERROR: %s' % e)
-        sys.exit(3)
+        fd = cpu_temp._fd
+    except AttributeError:
+        try:
+            fd = cpu_temp._fd = os.open(
+                '/sys/class/thermal/thermal_zone0/temp',
+                os.O_RDONLY
+            )
+        except IOError as e:
+            print('ERROR: %s' % e)
+            sys.exit(3)
+    # The kernel reports integer millidegrees - int() on the raw bytes
+    # is cheaper than the float() string parser.
+    return int(os.pread(fd, 16, 0)) * 0.001
 
 def gpu_temp():
-    cmd = '/opt/vc/bin/vcgencmd'
-    arg = 'measure_temp'
-    string = subprocess.check_output([cmd, arg]).decode('utf-8')
-    return float(string[string.find('=') + 1:].strip().rstrip('\'C'))
+    raw = vcgencmd.query(b'measure_temp')
+    return float(raw.partition(b'=')[2].rstrip(b'\'C\n'))
 
 def get_throttled():
     """
@@ -350,40 +542,46 @@ def get_throttled():
     17: arm frequency capped has occurred
     18: throttling has occurred
     """
-    cmd = '/opt/vc/bin/vcgencmd'
-    arg = 'get_throttled'
-    string = subprocess.check_output([cmd, arg]).decode('utf-8')
-    return int(string[string.find('=') + 1:].strip(), 16)
+    raw = vcgencmd.query(b'get_throttled')
+    return int(raw.partition(b'=')[2], 16)
 
 def cpu_volts():
     """ARM (and VideoCore) core voltage (float)"""
-    cmd  = '/opt/vc/bin/vcgencmd'
-    arg1 = 'measure_volts'
-    arg2 = 'core'
-    string = subprocess.check_output([cmd, arg1, arg2]).decode('utf-8')
-    return float(string[string.find('=') + 1:].strip().rstrip('\'V'))
+    raw = vcgencmd.query(b'measure_volts core')
+    return float(raw.partition(b'=')[2].rstrip(b'\'V\n'))
 
 def lapsed_time(now):
-    """HH:MM:SS string since 't' (for console output)"""
+    """HH:MM:SS string since first call (for console output)
+
+    'now' is a time.monotonic_ns() value."""
     try:
         (lapsed_time.start_time)
     except:
         lapsed_time.start_time = now
-    lapsed = now - lapsed_time.start_time
-    return time.strftime("%H:%M:%S", time.gmtime(lapsed))
-
-def console_throttling_alert(data):
-    """Issues a console boop every 'interval' seconds, if data.throttled is flagged"""
+    sec = (now - lapsed_time.start_time) // 1000000000
+    # The string changes once a second but is requested twice per tick
+    # (or more, with sub-second intervals) - reuse the last one.
+    cached = getattr(lapsed_time, '_cached', (None, None))
+    if cached[0] == sec:
+        return cached[1]
+    string = '%02d:%02d:%02d' % (sec // 3600, (sec // 60) % 60, sec % 60)
+    lapsed_time._cached = (sec, string)
+    return string
+
+def console_throttling_alert(data, now):
+    """Issues a console boop every 'interval' seconds, if data.throttled is flagged
+
+    'now' is a time.monotonic_ns() value."""
     if Config.Console_Alert is None:
         return
     try:
         (console_throttling_alert.last_beep)
     except:
-        console_throttling_alert.last_beep = time.time()
+        console_throttling_alert.last_beep = now
     if (data.throttled & 0x07) == 0:
         return
-    if (time.time() - console_throttling_alert.last_beep) > Config.Console_Alert:
-        console_throttling_alert.last_beep = time.time()
+    if (now - console_throttling_alert.last_beep) > Config.Console_Alert * 1e9:
+        console_throttling_alert.last_beep = now
         print('\a', end = "\r", flush = True)
 
 def csv_write_header(csv):
@@ -499,6 +697,18 @@ if __name__ == "__main__":
     #
     # Print program header
     #
+    # The four hardware queries are independent and I/O-bound, so they
+    # run in parallel - banner time becomes that of the slowest query
+    # instead of their sum.
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 4) as executor:
+        model_future    = executor.submit(get_model)
+        revision_future = executor.submit(get_revision)
+        serial_future   = executor.submit(get_serial)
+        firmware_future = executor.submit(get_firmware)
+        model    = model_future.result()
+        revision = revision_future.result()
+        serial   = serial_future.result()
+        firmware = firmware_future.result()
     print(HEADER)
     print(
         "Running Python ver.{} on {} {}" \
@@ -508,8 +718,8 @@ if __name__ == "__main__":
             platform.release()
         )
     )
-    print("{}, rev {}".format(get_model(), get_revision()))
-    print("Serial: {}".format(get_serial()))
+    print("{}, rev {}".format(model, revision))
+    print("Serial: {}".format(serial))
     print(
         "{} cores are available ({} cores in current OS)" \
         .format(
@@ -519,7 +729,7 @@ if __name__ == "__main__":
     )
     print(
         "GPU Firmware\n" + \
-        '\t' + '\t'.join(get_firmware().splitlines(True))
+        '\t' + '\t'.join(firmware.splitlines(True))
     )
  
 
@@ -527,45 +737,80 @@ if __name__ == "__main__":
         print("WARNING: You should not use interval less than 0.5 seconds!")
 
     data = Data(Config.CSV_Dialect)
+    # Every registered dialect can emit data rows via Data.csv_line() -
+    # each field is the time string or a formatted number - so the csv
+    # module is only needed for the free-form header block (and for rows
+    # of a dialect with a quoting policy csv_line() does not cover).
+    csv_fastpath = data.csv_fastpath
     if Config.CSV_File is not None:
-        csv_file = open(Config.CSV_File, 'w')
-        csv = csv.writer(csv_file, dialect=Config.CSV_Dialect)
+        # Rows are collected into an in-memory buffer and written out
+        # every Config.CSV_Flush_Rows rows (and on CTRL-C), so that long
+        # runs do not pay the csv/file write cost on every interval.
+        csv_file = open(Config.CSV_File, 'w', buffering = 1 << 16)
+        csv_buffer = io.StringIO()
+        csv = csv.writer(csv_buffer, dialect=Config.CSV_Dialect)
         csv_write_header(csv)
         csv.writerow(data.header())
+        csv_file.write(csv_buffer.getvalue())
+        csv_buffer.seek(0)
+        csv_buffer.truncate()
+        # Header is flushed out entirely; from here on the batched rows
+        # are written straight to the underlying fd.
+        csv_file.flush()
+        csv_fd = csv_file.fileno()
+        csv_buffered_rows = 0
 
     print("\nPress CTRL-C to terminate...")
-    start_time = time.time()        # For console
-    next_tick = start_time + 0.5    # 500 ms so that first sleep won't get negative number
+    # Prebuilt bytes template for the per-tick console line, written to
+    # the raw stdout buffer - skips re-parsing a .format() string and the
+    # TextIOWrapper encode on every tick. '\xc2\xba' is UTF-8 for 'º'.
+    console_template = (
+        b'[%s] CPU: %4.1f\xc2\xbaC %.2fV %5.1f%% @ %6.1f MHz, '
+        b'GPU: %4.1f\xc2\xbaC %s\r'
+    )
+    # Tick bookkeeping is done in integer nanoseconds, with one
+    # time.monotonic_ns() call per loop - after the sleep, next_tick
+    # itself is the current time, closely enough for the helpers.
+    start_time  = time.monotonic_ns()       # For console
+    interval_ns = int(Config.Interval * 1e9)
+    next_tick = start_time + 500000000      # 500 ms so that first sleep won't get negative number
     while True:
         try:
-            sleep_duration = next_tick - time.time()
+            sleep_duration = (next_tick - time.monotonic_ns()) / 1e9
             # Avoid lag-induced negative sleep times
             if sleep_duration > 0:
                 # Sleep until next_tick
                 time.sleep(sleep_duration)
             # Measure and write CSV
             data.read(next_tick)
-            console_throttling_alert(data)
+            console_throttling_alert(data, next_tick)
             if Config.CSV_File is not None:
-                csv.writerow(data.row())
-            print(
-                "[{}] CPU: {:>4.1f}ºC {:>1.2f}V {:>5.1f}% @ {:>6.1f} MHz, "\
-                "GPU: {:>4.1f}ºC {}"
-                .format(
-                        lapsed_time(next_tick),
-                        data.cpu_temp,
-                        data.cpu_volts,
-                        data.cpu_load,
-                        data.cpu_freq,
-                        data.gpu_temp,
-                        data.throttled_string()
-                ),
-                end = "\r",
-                flush = True
+                if csv_fastpath:
+                    csv_buffer.write(data.csv_line())
+                else:
+                    csv.writerow(data.row())
+                csv_buffered_rows += 1
+                if csv_buffered_rows >= Config.CSV_Flush_Rows:
+                    os.write(csv_fd, csv_buffer.getvalue().encode('ascii'))
+                    csv_buffer.seek(0)
+                    csv_buffer.truncate()
+                    csv_buffered_rows = 0
+            sys.stdout.buffer.write(
+                console_template % (
+                    lapsed_time(next_tick).encode('ascii'),
+                    data.cpu_temp,
+                    data.cpu_volts,
+                    data.cpu_load,
+                    data.cpu_freq,
+                    data.gpu_temp,
+                    data.throttled_string().encode('ascii')
+                )
             )
-            next_tick = next_tick + Config.Interval
+            sys.stdout.buffer.flush()
+            next_tick = next_tick + interval_ns
         except KeyboardInterrupt:
             try:
+                os.write(csv_fd, csv_buffer.getvalue().encode('ascii'))
                 csv_file.close()
             except:
                 pass